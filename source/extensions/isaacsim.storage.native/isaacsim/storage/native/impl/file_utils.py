@@ -13,15 +13,43 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import atexit
 import concurrent.futures
+import functools
+import heapq
 import os
-from typing import List
+import re
+import threading
+from collections import deque
+from typing import Iterator, List
 
 import carb
 from pxr import Sdf, UsdUtils
 
 from ..nucleus import get_assets_root_path_async
 
+# File extensions recognized as USD and MDL files
+_USD_SUFFIXES = (".usd", ".usda", ".usdc", ".usdz")
+_MDL_SUFFIXES = (".mdl",)
+
+# URL schemes of online (non local) paths
+_ONLINE_SCHEMES = ("omniverse://", "http://", "https://", "ftp://", "sftp://")
+
+# URL schemes of absolute paths, matched case-insensitively
+_ABSOLUTE_SCHEMES = ("omniverse://", "file://", "http://", "https://")
+_ABSOLUTE_SCHEMES_MAX_LEN = max(len(scheme) for scheme in _ABSOLUTE_SCHEMES)
+
+# Maximum number of directory listings in flight during a traversal
+_LIST_MAX_WORKERS = 32
+
+# URL split into scheme, netloc and path
+_URL_RE = re.compile(r"^([a-z][a-z0-9+\-.]*)://([^/]+)(/.*)?$", re.IGNORECASE)
+
+# Thread pools shared across calls, created on first use
+_EXECUTOR = None
+_LIST_EXECUTOR = None
+_EXECUTOR_LOCK = threading.Lock()
+
 
 def path_join(base, name):
     """Join two path components intelligently handling Omniverse URLs.
@@ -55,6 +83,31 @@ def path_join(base, name):
         return os.path.join(base, name)
 
 
+def _path_joiner(base):
+    """Create a function joining names onto a fixed base path.
+
+    Omniverse URLs take a fast path that concatenates plain names directly and only falls back to
+    ``path_join`` for names starting with ``./`` or ``../``.
+
+    Args:
+        base: Base path, can be local or Omniverse URL.
+
+    Returns:
+        Function that takes a name and returns the joined path string.
+    """
+    if not base.startswith("omniverse://"):
+        return functools.partial(path_join, base)
+
+    prefix = (base[:-1] if base.endswith("/") else base) + "/"
+
+    def join(name):
+        if name.startswith(("./", "../")):
+            return path_join(base, name)
+        return prefix + name
+
+    return join
+
+
 def is_local_path(path: str) -> bool:
     """Check if a path is local vs online (omniverse://, https://, etc.).
 
@@ -79,45 +132,175 @@ def is_local_path(path: str) -> bool:
     if not path:
         return True  # Empty paths are considered local
 
-    path = path.strip()
+    # Only strip when needed, most paths have no surrounding whitespace
+    if path[0].isspace() or path[-1].isspace():
+        path = path.strip()
 
-    # Check for online URL schemes
-    online_schemes = ["omniverse://", "http://", "https://", "ftp://", "sftp://"]
+    # Local paths (absolute or relative) are considered local
+    return not path.startswith(_ONLINE_SCHEMES)
 
-    for scheme in online_schemes:
-        if path.startswith(scheme):
-            return False
 
-    # Local paths (absolute or relative) are considered local
-    return True
+def _get_list_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared thread pool used to issue directory listings in parallel.
+
+    Returns:
+        Lazily created thread pool executor reused across traversals.
+    """
+    global _LIST_EXECUTOR
+    # Called from traversals running on worker threads, so creation must be guarded
+    with _EXECUTOR_LOCK:
+        if _LIST_EXECUTOR is None:
+            _LIST_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_LIST_MAX_WORKERS, thread_name_prefix="isaac-fileutils-list"
+            )
+            atexit.register(_LIST_EXECUTOR.shutdown, wait=False)
+    return _LIST_EXECUTOR
+
+
+def _list_folder(path, file_filter):
+    """List a single folder and split its entries into matching files and sub-folders.
+
+    Args:
+        path: Folder path to list.
+        file_filter: Filter function that takes an entry and its joined path and returns boolean
+            indicating if the file should be included.
+
+    Returns:
+        Tuple of (matching file paths, sub-folder paths). Both are empty if the listing failed.
+    """
+    import omni.client
+    from omni.client import Result
+
+    files = []
+    folders = []
+    result, entries = omni.client.list(path)
+    if result == Result.OK:
+        join = _path_joiner(path)
+        for entry in entries:
+            entry_path = join(entry.relative_path)
+            if entry.flags & 4:  # 4 is the directory flag
+                folders.append(entry_path)
+            elif file_filter(entry, entry_path):
+                files.append(entry_path)
+    return files, folders
+
+
+def _iter_folders(abs_paths, file_filter, max_depth=None):
+    """Walk folders breadth-first, listing all folders of the same depth in parallel.
+
+    Files are yielded as soon as the listing of their folder completes.
+
+    Args:
+        abs_paths: List of absolute paths to start from.
+        file_filter: Filter function forwarded to ``_list_folder``.
+        max_depth: Maximum recursion depth for directory traversal. If None, searches without depth limit.
+
+    Yields:
+        File paths that match the filter criteria.
+    """
+    executor = _get_list_executor()
+    # Track paths with their current depth: [(path, depth)]
+    current_level = [(path, 0) for path in abs_paths]
+    while current_level:
+        next_level = []
+        futures = {executor.submit(_list_folder, path, file_filter): depth for path, depth in current_level}
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                depth = futures[future]
+                level_files, folders = future.result()
+                yield from level_files
+                # If we haven't exceeded max depth, add sub-folders to the next level
+                if max_depth is None or depth < max_depth:
+                    next_level.extend((folder, depth + 1) for folder in folders)
+        finally:
+            # Drop pending listings if the consumer stops early
+            for future in futures:
+                future.cancel()
+        current_level = next_level
 
 
 def find_files_recursive(abs_path, filter_fn=lambda a: True):
     """Recursively list all files under given path(s) that match the filter function.
 
+    Folders at the same depth are listed in parallel, so results are sorted to keep the order deterministic.
+
     Args:
         abs_path: List of absolute paths to search.
         filter_fn: Filter function that takes a path and returns boolean indicating if path should be included.
 
     Returns:
-        List of file paths that match the filter criteria.
+        List of file paths that match the filter criteria, sorted by path.
     """
-    import omni.client
-    from omni.client import Result
+    return sorted(_iter_folders(abs_path, lambda entry, entry_path: filter_fn(entry.relative_path)))
 
-    sub_folders = []
-    remaining_folders = []
-    remaining_folders.extend(abs_path)
-    files = []
-    while remaining_folders:
-        path = remaining_folders.pop()
-        result, entries = omni.client.list(path)
-        if result == Result.OK:
-            files.extend(
-                [path_join(path, e.relative_path) for e in entries if (e.flags & 4) == 0 and filter_fn(e.relative_path)]
-            )
-            remaining_folders.extend([path_join(path, e.relative_path) for e in entries if (e.flags & 4) > 0])
-    return files
+
+def iter_filtered_files(
+    abs_paths: List[str],
+    max_depth: int = None,
+    filepath_excludes: List[str] = [],
+    filter_patterns: List[str] = [],
+    match_all: bool = False,
+) -> Iterator[str]:
+    """Iterate over USD files recursively with optional depth and pattern constraints.
+
+    Generator version of find_filtered_files: files are yielded as soon as their folder has been
+    listed, so callers can start processing results (or stop early) before the traversal completes.
+    The same file may be yielded more than once if it is reachable from several of the abs_paths.
+
+    Args:
+        abs_paths: List of absolute directory or file paths to search. Supports local paths and omniverse:// URLs.
+        max_depth: Maximum recursion depth for directory traversal. If None, searches
+            without depth limit. Depth 0 means current directory only.
+        filepath_excludes: List of strings that, if found in a filepath, will exclude that file from results.
+        filter_patterns: List of regex pattern strings to filter discovered filepaths.
+        match_all: If True, all patterns in filter_patterns must match. If False, any single pattern match
+            includes the file.
+
+    Yields:
+        Absolute paths to valid USD files that match all filtering criteria.
+
+    Example:
+
+    .. code-block:: python
+
+        # Stop at the first USD file matching a pattern
+        >>> first_match = next(iter_filtered_files(["/Isaac/Samples"], filter_patterns=["carter"]), None)
+    """
+    # Compile regex patterns once for efficiency
+    compiled_patterns = []
+    if filter_patterns:
+        for pattern_str in filter_patterns:
+            try:
+                compiled_patterns.append(re.compile(pattern_str))
+            except re.error:
+                carb.log_warn(f"Invalid regex pattern: {pattern_str}")
+
+    # Collapse patterns into a single alternation so ANY matching is one regex search per file.
+    # Joining renumbers capture groups (changing backreferences), so only patterns without groups are combined.
+    combined_pattern = None
+    if compiled_patterns and not match_all and all(pattern.groups == 0 for pattern in compiled_patterns):
+        try:
+            combined_pattern = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in compiled_patterns))
+        except re.error:
+            # Patterns that are only valid standalone (e.g. inline global flags) are matched one by one
+            combined_pattern = None
+
+    def file_filter(entry, entry_path):
+        # Apply USD file validation and filtering
+        if not is_valid_usd_file(entry_path, filepath_excludes):
+            return False
+        # Apply pattern filters if provided
+        if filter_patterns:
+            if match_all:  # ALL patterns must match
+                return all(pattern.search(entry_path) for pattern in compiled_patterns)
+            # ANY pattern can match (default)
+            if combined_pattern is not None:
+                return combined_pattern.search(entry_path) is not None
+            return any(pattern.search(entry_path) for pattern in compiled_patterns)
+        # No pattern filters, just add valid USD file
+        return True
+
+    yield from _iter_folders(abs_paths, file_filter, max_depth)
 
 
 def find_filtered_files(
@@ -132,7 +315,8 @@ def find_filtered_files(
     Traverses directory trees starting from the provided absolute paths to discover valid USD files.
     Supports recursive search with configurable depth limits, filepath exclusion patterns,
     and regex-based filtering. Uses Omniverse client for robust file system operations
-    across local and remote paths.
+    across local and remote paths. Folders at the same depth are listed in parallel.
+    See iter_filtered_files to process results while the traversal is still running.
 
     Args:
         abs_paths: List of absolute directory or file paths to search. Supports local paths and omniverse:// URLs.
@@ -175,54 +359,7 @@ def find_filtered_files(
         ...     match_all=True,
         ... )
     """
-    import re
-
-    import omni.client
-    from omni.client import Result
-
-    usd_files = set()
-    # Track paths with their current depth: [(path, depth)]
-    remaining_folders = [(path, 0) for path in abs_paths]
-
-    # Compile regex patterns once for efficiency
-    compiled_patterns = []
-    if filter_patterns:
-        for pattern_str in filter_patterns:
-            try:
-                compiled_patterns.append(re.compile(pattern_str))
-            except re.error:
-                carb.log_warn(f"Invalid regex pattern: {pattern_str}")
-
-    while remaining_folders:
-        current_path, current_depth = remaining_folders.pop()
-
-        result, entries = omni.client.list(current_path)
-        if result == Result.OK:
-            for entry in entries:
-                entry_path = path_join(current_path, entry.relative_path)
-
-                # Check if it's a file (not a directory)
-                if (entry.flags & 4) == 0:  # 4 is the directory flag
-                    # Apply USD file validation and filtering
-                    if is_valid_usd_file(entry_path, filepath_excludes):
-                        # Apply pattern filters if provided
-                        if filter_patterns:
-                            if match_all:  # ALL patterns must match
-                                if all(pattern.search(entry_path) for pattern in compiled_patterns):
-                                    usd_files.add(entry_path)
-                            else:  # ANY pattern can match (default)
-                                if any(pattern.search(entry_path) for pattern in compiled_patterns):
-                                    usd_files.add(entry_path)
-                        else:
-                            # No pattern filters, just add valid USD file
-                            usd_files.add(entry_path)
-
-                # If it's a directory and we haven't exceeded max depth, add to queue
-                elif (entry.flags & 4) > 0:
-                    if max_depth is None or current_depth < max_depth:
-                        remaining_folders.append((entry_path, current_depth + 1))
-
-    return usd_files
+    return set(iter_filtered_files(abs_paths, max_depth, filepath_excludes, filter_patterns, match_all))
 
 
 def get_stage_references(stage_path, resolve_relatives=True):
@@ -236,19 +373,18 @@ def get_stage_references(stage_path, resolve_relatives=True):
         List of path strings to referenced assets.
     """
     (all_layers, all_assets, unresolved_paths) = UsdUtils.ComputeAllDependencies(stage_path)
-    paths = []
+    if not resolve_relatives:
+        return list({layer.identifier for layer in all_layers})
+
+    paths = set()
 
     def add_path(path):
-        paths.append(path)
+        paths.add(path)
         return path
 
-    if resolve_relatives:
-        for layer in all_layers:
-            UsdUtils.ModifyAssetPaths(layer, add_path)
-    else:
-        paths = [str(layer).split("'")[1] for layer in all_layers]
-    paths = list(set(paths))
-    return paths
+    for layer in all_layers:
+        UsdUtils.ModifyAssetPaths(layer, add_path)
+    return list(paths)
 
 
 def is_absolute_path(path):
@@ -260,13 +396,8 @@ def is_absolute_path(path):
     Returns:
         Boolean indicating if path is absolute.
     """
-    if path.lower().startswith("omniverse://"):
-        return True
-    if path.lower().startswith("file://"):
-        return True
-    if path.lower().startswith("http://"):
-        return True
-    if path.lower().startswith("https://"):
+    # Only lowercase the part of the path that can hold a scheme
+    if path[:_ABSOLUTE_SCHEMES_MAX_LEN].lower().startswith(_ABSOLUTE_SCHEMES):
         return True
     return os.path.isabs(path)
 
@@ -282,13 +413,9 @@ def is_valid_usd_file(item, excludes):
         Boolean indicating if the path is a valid USD file.
     """
     # remove any substrings we dont want
-    for e in excludes:
-        if e in item:
-            return False
-    _, ext = os.path.splitext(item)
-    if ext in [".usd", ".usda", ".usdc", ".usdz"]:
-        return True
-    return False
+    if excludes and any(e in item for e in excludes):
+        return False
+    return item.endswith(_USD_SUFFIXES)
 
 
 def is_mdl_file(item):
@@ -300,27 +427,108 @@ def is_mdl_file(item):
     Returns:
         Boolean indicating if the path is an MDL file.
     """
-    _, ext = os.path.splitext(item)
-    return ext in [".mdl"]
+    return item.endswith(_MDL_SUFFIXES)
+
+
+async def _scan_usd_tree(base_path, scan_fn, *args):
+    """Walk a directory tree and scan its USD files with a pool of worker coroutines.
+
+    Workers share a single queue of folders to list and USD files to scan, so each USD file is
+    scanned as soon as it is discovered, while other workers keep listing. Directory listings run
+    concurrently, but USD scans run one at a time on the event loop thread since USD layer access is
+    not thread-safe (layers are shared through the Sdf registry with the stage open in Kit).
+
+    Args:
+        base_path: Base path to search for USD files.
+        scan_fn: Function that takes a USD file path (and ``args``) and returns a list of findings.
+        *args: Additional arguments forwarded to ``scan_fn``.
+
+    Returns:
+        Dictionary mapping file paths to their non-empty lists of findings, in nondeterministic order.
+    """
+    import omni.client
+    from omni.client import Result
+
+    results = {}
+    # Queue of (path, is_folder) items
+    queue = asyncio.Queue()
+    queue.put_nowait((base_path, True))
+
+    async def worker():
+        while True:
+            path, is_folder = await queue.get()
+            try:
+                if is_folder:
+                    result, entries = await omni.client.list_async(path)
+                    if result == Result.OK:
+                        join = _path_joiner(path)
+                        for entry in entries:
+                            if entry.flags & 4:  # 4 is the directory flag
+                                queue.put_nowait((join(entry.relative_path), True))
+                            elif is_valid_usd_file(entry.relative_path, []):
+                                queue.put_nowait((join(entry.relative_path), False))
+                else:
+                    findings = scan_fn(path, *args)
+                    if findings:
+                        results[path] = findings
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(_LIST_MAX_WORKERS)]
+    join_task = asyncio.ensure_future(queue.join())
+    try:
+        # Workers only finish by raising, so stop on the first error or once all items are processed
+        done, _ = await asyncio.wait([join_task, *workers], return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result()
+    finally:
+        join_task.cancel()
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(join_task, *workers, return_exceptions=True)
+    return results
+
+
+def _scan_absolute_references(stage_path):
+    """List the absolute references of a USD file.
+
+    Args:
+        stage_path: Path to the USD file.
+
+    Returns:
+        List of absolute references in the USD file.
+    """
+    return [i for i in get_stage_references(stage_path) if is_absolute_path(i)]
 
 
 async def find_absolute_paths_in_usds(base_path):
     """Check for absolute paths in USD files.
 
+    Each USD file is scanned as soon as it is discovered, while the directory traversal continues.
+
     Args:
         base_path: Base path to search for USD files.
 
     Returns:
         Dictionary mapping file paths to lists of absolute references they contain.
+        The order of the entries is nondeterministic.
+    """
+    return await _scan_usd_tree(base_path, _scan_absolute_references)
+
+
+@functools.lru_cache(maxsize=64)
+def _path_prefix(base_path):
+    """Normalize a base path into a prefix that only matches paths inside it.
+
+    Cached since callers check many references against the same few base paths.
+
+    Args:
+        base_path: Base path to normalize.
+
+    Returns:
+        Base path with forward slashes and a single trailing slash.
     """
-    abs_items = {}
-    files = await find_files_recursive(base_path, lambda item: is_valid_usd_file(item, []))
-    for i, item in enumerate(files):
-        print(f"check {i}/{len(files)}")
-        abs_refs = [i for i in get_stage_references(item) if is_absolute_path(i)]
-        if abs_refs:
-            abs_items[item] = abs_refs
-    return abs_items
+    return base_path.replace("\\", "/").rstrip("/") + "/"
 
 
 def is_path_external(path, base_path):
@@ -333,54 +541,86 @@ def is_path_external(path, base_path):
     Returns:
         Boolean indicating if path is external to base_path.
 
-    Raises:
-        Exception: If there's an error comparing the paths.
+    Note:
+        The path is external unless it starts with base_path (separators normalized to ``/``).
+        Server-relative base paths such as ``/Isaac`` therefore flag every full URL as external.
     """
-    try:
-        return base_path not in path
-    except:
-        print(path, base_path)
-        raise Exception("Error comparing paths")
+    return _is_external(path, _path_prefix(base_path))
+
+
+def _is_external(path, base_prefix):
+    """Check if a path is external to a normalized base path prefix.
+
+    Args:
+        path: Path to check.
+        base_prefix: Base path prefix as returned by ``_path_prefix``.
+
+    Returns:
+        Boolean indicating if path does not start with base_prefix.
+    """
+    return not path.startswith(base_prefix)
+
+
+def _scan_external_references(stage_path, base_prefix):
+    """List the references of a USD file that are external to a base path.
+
+    Args:
+        stage_path: Path to the USD file.
+        base_prefix: Base path prefix as returned by ``_path_prefix``.
+
+    Returns:
+        List of external references in the USD file.
+    """
+    return [i for i in get_stage_references(stage_path, resolve_relatives=False) if _is_external(i, base_prefix)]
 
 
 async def find_external_references(base_path):
     """Check for external references in USD files.
 
+    Each USD file is scanned as soon as it is discovered, while the directory traversal continues.
+
     Args:
         base_path: Base path to search for USD files.
 
     Returns:
         Dictionary mapping file paths to lists of external references they contain.
+        The order of the entries is nondeterministic.
     """
-    abs_items = {}
-    for item in await find_files_recursive(base_path, lambda item: is_valid_usd_file(item, [])):
-        parent = os.path.dirname(item)
-        abs_refs = [i for i in get_stage_references(item, resolve_relatives=False) if is_path_external(i, base_path)]
-        if abs_refs:
-            abs_items[item] = abs_refs
-    return abs_items
+    return await _scan_usd_tree(base_path, _scan_external_references, _path_prefix(base_path))
 
 
-async def count_asset_references(base_path):
+async def count_asset_references(base_path, verbose: bool = False, top_k: int | None = None):
     """Get reference counts for all assets in a base path.
 
     Args:
         base_path: Base path to search for assets.
+        verbose: If True, print each asset and the counted references it contains.
+        top_k: If set, only return the top_k least referenced assets. Selecting them is cheaper than
+            sorting all assets when top_k is small.
 
     Returns:
-        Dictionary mapping asset paths to their reference counts, sorted by count.
+        Dictionary mapping asset paths to their reference counts, sorted by count (ascending) then path.
+        When top_k is set, only the top_k assets with the lowest counts are included.
     """
-    items = {item: 0 for item in await find_files_recursive(base_path)}
+    items = {item: 0 for item in find_files_recursive([base_path])}
+    # Only references whose file name matches a discovered asset can be counted
+    basenames = {os.path.basename(item) for item in items}
     for item in items.keys():
-        print(item)
+        if verbose:
+            print(item)
+        join = _path_joiner(os.path.dirname(item))
         for i in get_stage_references(item):
-            base = os.path.dirname(item)
-            name = path_join(base, i)
-            print(" ", name)
+            if os.path.basename(i) not in basenames:
+                continue
+            name = join(i)
+            if verbose:
+                print(" ", name)
             if name in items:
                 items[name] += 1
-    items = {k: v for k, v in sorted(items.items(), key=lambda item: item[1])}
-    return items
+    # Ties in count are broken by path so the order (and any top_k cutoff) is deterministic
+    if top_k is not None:
+        return dict(heapq.nsmallest(top_k, items.items(), key=lambda item: (item[1], item[0])))
+    return dict(sorted(items.items(), key=lambda item: (item[1], item[0])))
 
 
 def find_missing_references(base_path):
@@ -389,7 +629,7 @@ def find_missing_references(base_path):
     Args:
         base_path: Base path to search for USD files.
     """
-    items = {item: 0 for item in find_files_recursive(base_path, lambda item: is_valid_usd_file(item, []))}
+    items = {item: 0 for item in find_files_recursive([base_path], lambda item: is_valid_usd_file(item, []))}
     for item in items.keys():
         (all_layers, all_assets, unresolved_paths) = UsdUtils.ComputeAllDependencies(item)
         if unresolved_paths:
@@ -412,6 +652,29 @@ async def path_exists(path):
     return result == Result.OK
 
 
+async def paths_exist(paths):
+    """Check if multiple paths exist, issuing all checks concurrently.
+
+    Args:
+        paths: Paths to check.
+
+    Returns:
+        Dictionary mapping each path to a boolean indicating if it exists.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> await paths_exist(["/home/user/file.usd", "/invalid/path.usd"])
+        {'/home/user/file.usd': True, '/invalid/path.usd': False}
+    """
+    import omni.client
+    from omni.client import Result
+
+    results = await asyncio.gather(*(omni.client.stat_async(path) for path in paths), return_exceptions=True)
+    return {path: not isinstance(result, Exception) and result[0] == Result.OK for path, result in zip(paths, results)}
+
+
 def layer_has_missing_references(layer_identifier):
     """Check if a layer has any missing references.
 
@@ -421,14 +684,14 @@ def layer_has_missing_references(layer_identifier):
     Returns:
         Boolean indicating if the layer has missing references.
     """
-    queue = [layer_identifier]
-    accessed_layers = []
+    queue = deque([layer_identifier])
+    accessed_layers = set()
     while queue:
-        identifier = queue.pop(0)
+        identifier = queue.popleft()
         if identifier in accessed_layers:
             continue
 
-        accessed_layers.append(identifier)
+        accessed_layers.add(identifier)
         layer = Sdf.Layer.FindOrOpen(identifier)
         if layer:
             for reference in layer.externalReferences:
@@ -494,21 +757,23 @@ def path_relative(path, start):
     Raises:
         ValueError: If URL scheme or domain doesn't match.
     """
-    from urllib.parse import urlparse
-
     # No trailing slash
     start = start.rstrip("/\\")
 
     # Determine if both are URLs
-    parsed_path = urlparse(path)
-    parsed_start = urlparse(start)
+    path_match = _URL_RE.match(path)
 
-    if parsed_path.scheme and parsed_path.netloc:
+    if path_match:
+        start_match = _URL_RE.match(start)
         # Ensure same scheme and netloc
-        if parsed_path.scheme != parsed_start.scheme or parsed_path.netloc != parsed_start.netloc:
+        if (
+            start_match is None
+            or path_match.group(1).lower() != start_match.group(1).lower()
+            or path_match.group(2) != start_match.group(2)
+        ):
             raise ValueError("URL scheme or domain mismatch.")
 
-        return os.path.relpath(parsed_path.path, parsed_start.path)
+        return os.path.relpath(path_match.group(3) or "", start_match.group(3) or "")
 
     else:
         # Local file paths (Windows, Linux)
@@ -524,15 +789,13 @@ def path_dirname(path):
     Returns:
         Directory path string.
     """
-    from urllib.parse import urlparse, urlunparse
-
-    parsed = urlparse(path)
+    match = _URL_RE.match(path)
     # URL
-    if parsed.scheme and parsed.netloc:
-        dir_path = os.path.dirname(parsed.path)
+    if match:
+        dir_path = os.path.dirname(match.group(3) or "")
         if not dir_path.endswith("/"):
             dir_path += "/"
-        return urlunparse((parsed.scheme, parsed.netloc, dir_path, "", "", ""))
+        return f"{match.group(1).lower()}://{match.group(2)}{dir_path}"
     else:
         return os.path.dirname(os.path.normpath(path)) + os.sep
 
@@ -589,6 +852,22 @@ async def resolve_asset_path_async(original_path: str) -> str | None:
     return None
 
 
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared thread pool used to run traversals off the main thread.
+
+    Returns:
+        Lazily created thread pool executor reused across calls.
+    """
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="isaac-fileutils"
+            )
+            atexit.register(_EXECUTOR.shutdown, wait=False)
+    return _EXECUTOR
+
+
 async def find_filtered_files_async(
     root_path: str,
     filter_patterns: List[str] = [],
@@ -598,7 +877,7 @@ async def find_filtered_files_async(
 ) -> set:
     """Asynchronously find and filter USD files recursively with optional depth and pattern constraints.
 
-    This is an async wrapper around find_filtered_files that uses a thread pool executor
+    This is an async wrapper around find_filtered_files that uses a shared thread pool executor
     to avoid blocking the main thread. Results are returned as a set for automatic deduplication.
 
     Args:
@@ -614,15 +893,14 @@ async def find_filtered_files_async(
 
     # Get filtered USD files with depth limit in one pass
     loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        usd_files_set = await loop.run_in_executor(
-            executor,
-            find_filtered_files,
-            [root_path],
-            max_depth,
-            filepath_excludes,
-            filter_patterns,
-            match_all,
-        )
+    usd_files_set = await loop.run_in_executor(
+        _get_executor(),
+        find_filtered_files,
+        [root_path],
+        max_depth,
+        filepath_excludes,
+        filter_patterns,
+        match_all,
+    )
 
     return usd_files_set
@@ -15,13 +15,29 @@
 
 import asyncio
 import json
+import os
+import re
+import tempfile
 
 import carb
 import omni.kit.commands
 import omni.kit.test
 
 # import omni.kit.usd
-from isaacsim.storage.native import find_filtered_files_async, get_assets_root_path, get_assets_root_path_async
+import isaacsim.storage.native.impl.file_utils as file_utils
+from isaacsim.storage.native import (
+    count_asset_references,
+    find_absolute_paths_in_usds,
+    find_external_references,
+    find_filtered_files_async,
+    get_assets_root_path,
+    get_assets_root_path_async,
+    iter_filtered_files,
+    path_dirname,
+    path_relative,
+    paths_exist,
+)
+from pxr import Sdf
 
 
 class TestStorageNative(omni.kit.test.AsyncTestCase):
@@ -67,6 +83,49 @@ class TestStorageNative(omni.kit.test.AsyncTestCase):
         # reset settings
         carb.settings.get_settings().set("/persistent/isaac/asset_root/default", default_assets_url)
 
+    async def test_path_relative_and_dirname(self):
+        """Test URL and local path handling of path_relative and path_dirname."""
+        # Omniverse and HTTPS URLs
+        self.assertEqual(
+            path_relative("omniverse://server/Isaac/Robots/robot.usd", "omniverse://server/Isaac/"),
+            os.path.join("Robots", "robot.usd"),
+        )
+        self.assertEqual(path_dirname("omniverse://server/Isaac/Robots/robot.usd"), "omniverse://server/Isaac/Robots/")
+        self.assertEqual(path_dirname("omniverse://server"), "omniverse://server/")
+        self.assertEqual(
+            path_relative("https://host:443/Assets/Isaac/robot.usd", "https://host:443/Assets"),
+            os.path.join("Isaac", "robot.usd"),
+        )
+        self.assertEqual(path_dirname("https://host:443/Assets/Isaac/robot.usd"), "https://host:443/Assets/Isaac/")
+
+        # Windows drive paths are local paths, not URLs
+        self.assertEqual(path_relative("C:/Assets/Isaac/robot.usd", "C:/Assets"), os.path.join("Isaac", "robot.usd"))
+        self.assertEqual(path_dirname("C:/Assets/robot.usd"), os.path.normpath("C:/Assets") + os.sep)
+
+        # file:/// URLs have no netloc and are handled as local paths
+        self.assertEqual(
+            path_relative("file:///Assets/Isaac/robot.usd", "file:///Assets"), os.path.join("Isaac", "robot.usd")
+        )
+        self.assertEqual(path_dirname("file:///Assets/robot.usd"), os.path.normpath("file:///Assets") + os.sep)
+
+        # Scheme or netloc mismatch
+        with self.assertRaises(ValueError):
+            path_relative("omniverse://server1/Isaac/robot.usd", "omniverse://server2/Isaac")
+        with self.assertRaises(ValueError):
+            path_relative("https://server/Isaac/robot.usd", "omniverse://server/Isaac")
+        with self.assertRaises(ValueError):
+            path_relative("omniverse://server/Isaac/robot.usd", "/Isaac")
+
+    async def test_paths_exist(self):
+        """Test batched existence checks for existing and missing paths."""
+        assets_root_path = await get_assets_root_path_async()
+        existing_path = assets_root_path + "/Isaac/Environments/Simple_Room/simple_room.usd"
+        missing_path = "/invalid/nonexistent/path.usd"
+
+        result = await paths_exist([existing_path, missing_path])
+        self.assertEqual(result, {existing_path: True, missing_path: False})
+        self.assertEqual(await paths_exist([]), {})
+
     async def test_find_filtered_files_async_basic_discovery(self):
         """Test basic USD file discovery without filters.
 
@@ -92,6 +151,125 @@ class TestStorageNative(omni.kit.test.AsyncTestCase):
                 f"File should have valid USD extension: {file_path}",
             )
 
+    async def test_iter_filtered_files(self):
+        """Test that the generator yields known files within the depth limit and can stop early."""
+        simple_room_path = await get_assets_root_path_async()
+        simple_room_path += "/Isaac/Environments/Simple_Room/"
+
+        # simple_room.usd sits directly in the root folder, so it is found at depth 0
+        shallow_files = list(iter_filtered_files([simple_room_path], max_depth=0))
+        self.assertTrue(
+            any(file_path.endswith("/simple_room.usd") for file_path in shallow_files),
+            f"simple_room.usd should be yielded at depth 0: {shallow_files}",
+        )
+
+        # Count folder listings to compare a full traversal against an early stop
+        listed_folders = []
+        list_folder = file_utils._list_folder
+
+        def counting_list_folder(path, file_filter):
+            listed_folders.append(path)
+            return list_folder(path, file_filter)
+
+        file_utils._list_folder = counting_list_folder
+        try:
+            full_files = list(iter_filtered_files([simple_room_path]))
+            full_listing_count = len(listed_folders)
+            self.assertGreater(full_listing_count, 1, "Simple Room should contain sub-folders")
+
+            listed_folders.clear()
+            generator = iter_filtered_files([simple_room_path])
+            first_file = next(generator)
+            generator.close()
+            self.assertIn(first_file, full_files)
+            self.assertLess(len(listed_folders), full_listing_count, "Closing should stop the traversal early")
+            with self.assertRaises(StopIteration):
+                next(generator)
+        finally:
+            file_utils._list_folder = list_folder
+
+    async def test_reference_audits(self):
+        """Test the absolute and external reference audits on a local folder of referencing layers."""
+
+        def create_layer(path, references):
+            layer = Sdf.Layer.CreateNew(path)
+            prim_spec = Sdf.CreatePrimInLayer(layer, "/World")
+            prim_spec.specifier = Sdf.SpecifierDef
+            layer.defaultPrim = "World"
+            for reference in references:
+                prim_spec.referenceList.Prepend(Sdf.Reference(reference))
+            layer.Save()
+            return layer
+
+        with tempfile.TemporaryDirectory() as root_dir, tempfile.TemporaryDirectory() as external_dir:
+            root_dir = os.path.realpath(root_dir)
+            external_dir = os.path.realpath(external_dir)
+            os.makedirs(os.path.join(root_dir, "sub"))
+
+            # a.usda references a layer outside the root by absolute path, sub/b.usda references a.usda
+            external_layer = create_layer(os.path.join(external_dir, "external.usda"), [])
+            create_layer(os.path.join(root_dir, "a.usda"), [external_layer.identifier])
+            create_layer(os.path.join(root_dir, "sub", "b.usda"), ["../a.usda"])
+            path_a = os.path.join(root_dir, "a.usda")
+            path_b = os.path.join(root_dir, "sub", "b.usda")
+
+            # Both layers reach the external layer, directly or through a.usda
+            self.assertEqual(
+                await find_absolute_paths_in_usds(root_dir),
+                {path_a: [external_layer.identifier], path_b: [external_layer.identifier]},
+            )
+            self.assertEqual(
+                await find_external_references(root_dir),
+                {path_a: [external_layer.identifier], path_b: [external_layer.identifier]},
+            )
+
+            # An error while scanning a file is raised instead of leaving the audit waiting
+            scan_absolute_references = file_utils._scan_absolute_references
+
+            def failing_scan(stage_path):
+                raise RuntimeError(f"Failed to scan {stage_path}")
+
+            file_utils._scan_absolute_references = failing_scan
+            try:
+                with self.assertRaises(RuntimeError):
+                    await asyncio.wait_for(find_absolute_paths_in_usds(root_dir), timeout=30)
+            finally:
+                file_utils._scan_absolute_references = scan_absolute_references
+
+    async def test_count_asset_references(self):
+        """Test reference counting and top_k selection on a local folder of referencing layers."""
+        # Each layer references the listed layers, giving unique counts: a=0, d=1, c=2, b=3
+        layer_references = {
+            "a.usda": ["b.usda", "c.usda", "d.usda"],
+            "b.usda": [],
+            "c.usda": ["b.usda"],
+            "d.usda": ["b.usda", "c.usda"],
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name, references in layer_references.items():
+                layer = Sdf.Layer.CreateNew(os.path.join(tmp_dir, name))
+                prim_spec = Sdf.CreatePrimInLayer(layer, "/World")
+                prim_spec.specifier = Sdf.SpecifierDef
+                layer.defaultPrim = "World"
+                for reference in references:
+                    prim_spec.referenceList.Prepend(Sdf.Reference(reference))
+                layer.Save()
+
+            counts = await count_asset_references(tmp_dir)
+            self.assertEqual(
+                counts,
+                {
+                    os.path.join(tmp_dir, name): count
+                    for name, count in [("a.usda", 0), ("d.usda", 1), ("c.usda", 2), ("b.usda", 3)]
+                },
+            )
+            self.assertEqual(list(counts.values()), sorted(counts.values()))
+
+            # top_k returns the first top_k entries of the full ascending result
+            for top_k in range(len(counts) + 1):
+                top_counts = await count_asset_references(tmp_dir, top_k=top_k)
+                self.assertEqual(list(top_counts.items()), list(counts.items())[:top_k])
+
     async def test_find_filtered_files_async_pattern_filtering_any_mode(self):
         """Test regex pattern filtering with match_all=False (any pattern matches).
 
@@ -122,6 +300,15 @@ class TestStorageNative(omni.kit.test.AsyncTestCase):
                     f"File '{file_path}' should match at least one pattern ['room', 'Props'] in ANY mode",
                 )
 
+        # Patterns that can't be combined into one regex must give the same result as matching them one by one:
+        # backreferences change meaning once groups are renumbered, inline global flags must come first
+        all_files = await find_filtered_files_async(root_path=simple_room_path)
+        for patterns in [["Props", r"(o)\1"], ["Props", "(?i)SIMPLE"]]:
+            result = await find_filtered_files_async(root_path=simple_room_path, filter_patterns=patterns)
+            expected = {file_path for file_path in all_files if any(re.search(p, file_path) for p in patterns)}
+            self.assertGreater(len(expected), 0, f"Patterns {patterns} should match some files")
+            self.assertEqual(result, expected, f"Patterns {patterns} should match as if applied one by one")
+
     async def test_find_filtered_files_async_pattern_filtering_all_mode(self):
         """Test regex pattern filtering with match_all=True (all patterns must match).
 